@@ -0,0 +1,264 @@
+# vol_worker.py
+"""
+Long-lived Volatility worker used by volatility_mcp_server.py
+
+The Volatility framework is imported once at startup, after which the worker
+runs plugin invocations in-process for as long as the server keeps it alive.
+Messages are exchanged over stdin/stdout, each one being a 1-byte kind and a
+4-byte big-endian length followed by the body:
+
+    q  request, a JSON object with the vol.py arguments under "args"
+    o  a chunk of plugin output, sent while the plugin is still running
+    r  the final result, a JSON object with "returncode", "stderr" and "restart",
+       which asks the server to replace the worker before its next request
+
+Usage: python vol_worker.py <volatility_dir>
+"""
+import os
+import sys
+import io
+import json
+import struct
+import functools
+import gc
+import traceback
+import queue
+import signal
+import ctypes
+import logging
+import threading
+import contextlib
+
+HEADER = struct.Struct(">cI")
+MSG_REQUEST = b"q"
+MSG_OUTPUT = b"o"
+MSG_RESULT = b"r"
+
+CHUNK_SIZE = 64 * 1024  # Plugin output is forwarded once this much is buffered
+STDERR_LIMIT = 8 * 1024  # Only the tail of stderr is kept, it is only needed on failure
+
+def read_msg(stream):
+    """Read one message from a binary stream, returning (kind, body) or None on end of stream"""
+    header = stream.read(HEADER.size)
+    if len(header) < HEADER.size:
+        return None
+    kind, length = HEADER.unpack(header)
+    body = stream.read(length)
+    if len(body) < length:
+        return None
+    return kind, body
+
+def write_msg(stream, kind, body: bytes):
+    """Write one message to a binary stream"""
+    stream.write(HEADER.pack(kind, len(body)) + body)
+    stream.flush()
+
+class ChunkedOutput(io.TextIOBase):
+    """Text stream that forwards everything written to it as output messages"""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._pending = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        self._pending += text.encode('utf-8', errors='replace')
+        if len(self._pending) >= CHUNK_SIZE:
+            self.send()
+        return len(text)
+
+    def flush(self):
+        # Renderers flush frequently, output is only sent in whole chunks
+        pass
+
+    def send(self):
+        """Forward any buffered output to the server"""
+        if self._pending:
+            write_msg(self._stream, MSG_OUTPUT, bytes(self._pending))
+            self._pending.clear()
+
+class TailBuffer(io.TextIOBase):
+    """Text stream that only remembers the last `limit` characters written to it"""
+
+    def __init__(self, limit=STDERR_LIMIT):
+        self._limit = limit
+        self._text = ""
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        self._text = (self._text + text)[-self._limit:]
+        return len(text)
+
+    def getvalue(self):
+        return self._text
+
+def _exit_code(code):
+    """Translate a SystemExit code into a process-style return code"""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+# Settings of the constants module that the CLI overwrites from command line options
+_CONSTANTS_STATE = ("CACHE_PATH", "PARALLELISM", "OFFLINE", "REMOTE_ISF_URL")
+# Plugin modules imported during a run (from -p directories, however the option is
+# spelled) stay registered, so the worker is replaced after such a run
+_PLUGIN_PACKAGES = ("volatility3.plugins.", "volatility3.framework.plugins.")
+
+def _plugin_modules():
+    """Names of the plugin modules imported so far"""
+    return {name for name in sys.modules if name.startswith(_PLUGIN_PACKAGES)}
+
+def _clear_framework_caches():
+    """Empty the functools caches on Volatility classes
+
+    Methods such as the layers' read() are cached per instance, so the caches keep
+    the previous run's layers, context and symbol tables alive.
+    """
+    for name, module in list(sys.modules.items()):
+        if module is None or not name.startswith("volatility3"):
+            continue
+        for value in list(vars(module).values()):
+            if isinstance(value, type) and value.__module__ == name:
+                members = list(vars(value).values())
+            else:
+                members = [value]
+            for member in members:
+                # Unwrap properties, classmethods and staticmethods
+                member = getattr(member, "fget", None) or getattr(member, "__func__", member)
+                if isinstance(member, functools._lru_cache_wrapper):
+                    member.cache_clear()
+
+@contextlib.contextmanager
+def isolated_globals():
+    """Restore process-wide state the Volatility CLI changes during a run"""
+    import volatility3.plugins
+    import volatility3.symbols
+    from volatility3.framework import constants
+
+    rootlog = logging.getLogger()
+    handlers = list(rootlog.handlers)
+    level = rootlog.level
+    # -p/-s rebind __path__ to new lists; keep the original objects and their contents
+    paths = [(module, module.__path__, list(module.__path__))
+             for module in (volatility3.plugins, volatility3.symbols)]
+    constants_state = {name: getattr(constants, name) for name in _CONSTANTS_STATE}
+    tracebacklimit = getattr(sys, "tracebacklimit", None)
+    try:
+        yield
+    finally:
+        # Close handlers added by -l/--log so the log file is released
+        for handler in rootlog.handlers:
+            if handler not in handlers:
+                handler.close()
+        rootlog.handlers[:] = handlers
+        rootlog.setLevel(level)
+        for module, path, contents in paths:
+            path[:] = contents
+            module.__path__ = path
+        for name, value in constants_state.items():
+            setattr(constants, name, value)
+        if tracebacklimit is None:
+            sys.__dict__.pop("tracebacklimit", None)
+        else:
+            sys.tracebacklimit = tracebacklimit
+        _clear_framework_caches()
+        # Contexts and layers reference each other, free them before the next run
+        gc.collect()
+
+def run_plugin(cmd_args, protocol_out):
+    """Run a Volatility command line in-process, streaming its output to the server"""
+    import volatility3.cli
+
+    stdout = ChunkedOutput(protocol_out)
+    stderr = TailBuffer()
+    returncode = 0
+
+    # The CLI reads its arguments from sys.argv and logs through a module-level handler
+    sys.argv = ["vol.py"] + list(cmd_args)
+    volatility3.cli.console.setStream(stderr)
+    plugin_modules = _plugin_modules()
+
+    with isolated_globals(), contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            volatility3.cli.CommandLine().run()
+        except SystemExit as e:
+            returncode = _exit_code(e.code)
+        except Exception:
+            traceback.print_exc()
+            returncode = 1
+    stdout.send()
+
+    return {
+        "returncode": returncode,
+        "stderr": stderr.getvalue(),
+        "restart": bool(_plugin_modules() - plugin_modules),
+    }
+
+PR_SET_PDEATHSIG = 1
+
+def _die_with_parent():
+    """Ask Linux to kill the worker as soon as the server process dies"""
+    if not sys.platform.startswith("linux"):
+        return
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        libc.prctl(PR_SET_PDEATHSIG, signal.SIGKILL)
+    except (OSError, AttributeError):
+        pass
+
+def _read_requests(protocol_in, requests):
+    """Queue incoming messages, exiting the whole worker once the server closes stdin"""
+    while True:
+        msg = read_msg(protocol_in)
+        if msg is None:
+            # The server is gone; stop immediately, even in the middle of a plugin run
+            os._exit(0)
+        requests.put(msg)
+
+def main():
+    _die_with_parent()
+
+    volatility_dir = sys.argv[1] if len(sys.argv) > 1 else os.getcwd()
+    sys.path.insert(0, volatility_dir)
+
+    # Keep a private handle on the protocol channel and point fd 1 at stderr,
+    # so nothing printed by Volatility or its dependencies can corrupt it
+    protocol_in = sys.stdin.buffer
+    protocol_out = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    # Pay the framework import cost once for the lifetime of the worker. A failure is
+    # sent back as the result of the next request, stderr alone never reaches the client
+    startup_error = None
+    try:
+        import volatility3.cli
+        from volatility3 import framework, plugins
+        framework.import_files(plugins, True)
+    except Exception:
+        startup_error = traceback.format_exc()[-STDERR_LIMIT:]
+
+    # stdin is read on its own thread so that losing the server is noticed while
+    # a plugin is still running, not only between requests
+    requests = queue.Queue()
+    threading.Thread(target=_read_requests, args=(protocol_in, requests), daemon=True).start()
+
+    while True:
+        kind, body = requests.get()
+        if kind != MSG_REQUEST:
+            continue
+        if startup_error is not None:
+            result = {"returncode": 1, "stderr": startup_error, "restart": True}
+        else:
+            request = json.loads(body.decode('utf-8'))
+            result = run_plugin(request["args"], protocol_out)
+        write_msg(protocol_out, MSG_RESULT, json.dumps(result).encode('utf-8'))
+
+if __name__ == "__main__":
+    main()
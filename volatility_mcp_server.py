@@ -1,44 +1,386 @@
 # volatility_mcp_server.py
 import os
 import sys
+import stat
 import subprocess
+import io
 import json
+import struct
+import hashlib
+import tempfile
+import re
+import time
+import signal
+import threading
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Union
 import asyncio
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 
 from mcp.server.fastmcp import FastMCP, Context
 
+@asynccontextmanager
+async def server_lifespan(server):
+    """Build the plugin list once the server's event loop is running, and stop the workers on exit"""
+    loop = asyncio.get_running_loop()
+    if sys.platform != "win32":
+        loop.add_signal_handler(signal.SIGHUP, _invalidate_plugins)
+    try:
+        await _refresh_plugins()
+        yield
+    finally:
+        if sys.platform != "win32":
+            loop.remove_signal_handler(signal.SIGHUP)
+        await _WORKERS.stop()
+
 # Create an MCP server
-mcp = FastMCP("VolatilityForensics")
+mcp = FastMCP("VolatilityForensics", lifespan=server_lifespan)
 
 # Configuration
 # Using os.path to ensure cross-platform compatibility
 VOLATILITY_PYTHON = sys.executable  # Use the current Python interpreter
 VOLATILITY_DIR = os.path.normpath(r"C:\Users\visha\Desktop\volatility3")
 VOLATILITY_SCRIPT = os.path.join(VOLATILITY_DIR, "vol.py")
+VOLATILITY_PLUGIN_DIRS = [
+    os.path.join(VOLATILITY_DIR, "volatility3", "framework", "plugins"),
+    os.path.join(VOLATILITY_DIR, "volatility3", "plugins"),
+]
+VOLATILITY_WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "vol_worker.py")
+VOL_MAX_CONC = max(1, int(os.getenv("VOL_MAX_CONC", "4")))  # Maximum number of concurrent Volatility workers
+VOL_TIMEOUT = float(os.getenv("VOL_TIMEOUT", "3600"))  # Seconds before a plugin run is killed, 0 disables
+VOL_CACHE_OUTPUT = os.getenv("VOL_CACHE_OUTPUT", "1") != "0"  # Reuse plugin output for unchanged dumps
+VOL_CACHE_MAX_MB = float(os.getenv("VOL_CACHE_MAX_MB", "1024"))  # Size limit of the plugin output cache
+
+def _volatility_signature() -> str:
+    """Hash the mtimes of vol.py and of every plugin directory and module
+
+    Adding, removing or editing a plugin changes the signature, which invalidates
+    cached help and plugin output.
+    """
+    h = hashlib.sha256()
+    h.update(str(os.stat(VOLATILITY_SCRIPT).st_mtime_ns).encode())
+    for plugin_dir in VOLATILITY_PLUGIN_DIRS:
+        for root, dirs, files in os.walk(plugin_dir):
+            dirs.sort()
+            h.update(f"{root}:{os.stat(root).st_mtime_ns}".encode())
+            for name in sorted(files):
+                if name.endswith(".py"):
+                    h.update(f"{name}:{os.stat(os.path.join(root, name)).st_mtime_ns}".encode())
+    return h.hexdigest()
+
+# Cache for `vol.py -h` and `vol.py <plugin> --help` output. The plugin list is
+# static for a given Volatility install, so the output is reused until vol.py or
+# the plugins change. Entries map the cache key to (install signature, output).
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "volatility_mcp")
+PLUGINS_CACHE_FILE = os.path.join(CACHE_DIR, "plugins.json")
+_PLUGINS_CACHE: Dict[str, Tuple[str, str]] = {}
+
+def _load_plugins_cache():
+    """Load the persisted plugin help cache, ignoring a missing or corrupt file"""
+    try:
+        with open(PLUGINS_CACHE_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        for key, (signature, output) in data.items():
+            _PLUGINS_CACHE[key] = (str(signature), str(output))
+    except (OSError, ValueError, TypeError, AttributeError):
+        pass
+
+def _atomic_write(path, data: str):
+    """Write a file via a temporary file and os.replace so readers never see partial data"""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        # newline="" keeps \r characters in plugin output intact
+        with open(fd, "w", encoding="utf-8", newline="") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def _save_plugins_cache():
+    """Persist the plugin help cache so it survives server restarts"""
+    try:
+        _atomic_write(PLUGINS_CACHE_FILE, json.dumps(_PLUGINS_CACHE))
+    except OSError:
+        pass
+
+def _help_cache_key(cmd_args) -> Optional[str]:
+    """Return the plugin cache key for help invocations, or None if the command is not cacheable"""
+    if cmd_args == ["-h"]:
+        return "-h"
+    if len(cmd_args) == 2 and cmd_args[1] == "--help":
+        return cmd_args[0]
+    return None
+
+_load_plugins_cache()
+
+# On-disk cache of plugin output. Plugin runs are deterministic for a given dump,
+# so output is stored under a hash of the dump's identity and contents, the
+# Volatility install and the plugin arguments, and reused when a client asks for
+# the same plugin on the same dump again.
+OUTPUT_CACHE_DIR = os.path.join(CACHE_DIR, "output")
+_FINGERPRINT_BYTES = 1 << 20
+# Only plugins known to just read the dump are cached; plugins that write files
+# (dumpfiles, pedump, layerwriter, timeliner bodyfiles, ...) must always execute
+_CACHEABLE_PLUGINS = frozenset({
+    "windows.info.Info", "windows.pstree.PsTree", "windows.pslist.PsList",
+    "windows.psscan.PsScan", "windows.netscan.NetScan", "windows.malfind.Malfind",
+    "windows.cmdline.CmdLine", "windows.dlllist.DllList", "windows.handles.Handles",
+    "windows.filescan.FileScan", "windows.memmap.Memmap"
+})
+_FINGERPRINT_CACHE_SIZE = 128
+_FINGERPRINTS: "OrderedDict[Tuple[str, float], str]" = OrderedDict()
+_FINGERPRINTS_LOCK = threading.Lock()  # Fingerprints are computed on worker threads
+
+def _dump_fingerprint(path: str, st: os.stat_result) -> str:
+    """Hash the first and last MB of a dump plus its size, cached on (path, mtime)"""
+    key = (path, st.st_mtime)
+    with _FINGERPRINTS_LOCK:
+        fingerprint = _FINGERPRINTS.get(key)
+        if fingerprint is not None:
+            _FINGERPRINTS.move_to_end(key)
+            return fingerprint
+    
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        h.update(f.read(_FINGERPRINT_BYTES))
+        f.seek(max(st.st_size - _FINGERPRINT_BYTES, 0))
+        h.update(f.read())
+    h.update(str(st.st_size).encode())
+    fingerprint = h.hexdigest()
+    
+    with _FINGERPRINTS_LOCK:
+        _FINGERPRINTS[key] = fingerprint
+        _FINGERPRINTS.move_to_end(key)
+        if len(_FINGERPRINTS) > _FINGERPRINT_CACHE_SIZE:
+            _FINGERPRINTS.popitem(last=False)
+    return fingerprint
+
+def _is_cacheable(cmd_args) -> bool:
+    """Check a command is `-f <dump> <plugin>`, optionally followed by `--pid <n>`
+
+    These are the shapes the dedicated tools build. Any other option could write
+    files (argparse also accepts abbreviations such as --du for --dump), so runs
+    with other arguments always execute.
+    """
+    if len(cmd_args) < 3 or cmd_args[0] != "-f" or cmd_args[2] not in _CACHEABLE_PLUGINS:
+        return False
+    extra = cmd_args[3:]
+    return not extra or (len(extra) == 2 and extra[0] == "--pid" and extra[1].isdigit())
+
+def _output_cache_path(cmd_args) -> Optional[str]:
+    """Return the cache file for a plugin run, or None if its output cannot be cached"""
+    if not VOL_CACHE_OUTPUT or not _is_cacheable(cmd_args):
+        return None
+    path = os.path.normpath(cmd_args[1])
+    try:
+        st = os.stat(path)
+        fingerprint = _dump_fingerprint(path, st)
+        signature = _volatility_signature()
+    except OSError:
+        return None
+    # The sampled fingerprint alone cannot tell apart dumps of the same size, so the
+    # file's identity is part of the key; the install signature invalidates entries
+    # after an upgrade or a plugin change
+    key_material = json.dumps([
+        fingerprint, path, st.st_ino, st.st_mtime_ns, st.st_size, signature, cmd_args[2:]
+    ])
+    key = hashlib.sha256(key_material.encode()).hexdigest()
+    return os.path.join(OUTPUT_CACHE_DIR, key)
+
+def _read_cached_output(cache_path: str) -> Optional[str]:
+    try:
+        with open(cache_path, "r", encoding="utf-8", newline="") as f:
+            output = f.read()
+        # Entries are evicted least recently used first
+        os.utime(cache_path)
+        return output
+    except OSError:
+        return None
+
+def _prune_output_cache():
+    """Evict the least recently used entries until the cache fits in VOL_CACHE_MAX_MB"""
+    limit = VOL_CACHE_MAX_MB * 1024 * 1024
+    entries = []
+    total = 0
+    with os.scandir(OUTPUT_CACHE_DIR) as it:
+        for entry in it:
+            if entry.is_file() and not entry.name.endswith(".tmp"):
+                st = entry.stat()
+                entries.append((st.st_mtime, st.st_size, entry.path))
+                total += st.st_size
+    for _, size, path in sorted(entries):
+        if total <= limit:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+
+def _store_cached_output(cache_path: str, output: str):
+    try:
+        _atomic_write(cache_path, output)
+        _prune_output_cache()
+    except OSError:
+        pass
+
+# Persistent Volatility workers. Each worker imports the framework once and then
+# runs plugins in-process, avoiding the interpreter and import cost of spawning
+# vol.py for every tool call. Messages are a 1-byte kind and a 4-byte big-endian
+# length followed by the body; plugin output is streamed back in chunks while the
+# plugin runs (see vol_worker.py).
+_MSG_HEADER = struct.Struct(">cI")
+_MSG_REQUEST = b"q"
+_MSG_OUTPUT = b"o"
+_MSG_RESULT = b"r"
+
+class VolatilityWorker:
+    """A long-lived vol_worker.py subprocess, restarted automatically if it dies"""
+
+    def __init__(self, cwd=VOLATILITY_DIR):
+        self.cwd = cwd
+        self.process = None
+
+    async def start(self):
+        self.process = await asyncio.create_subprocess_exec(
+            VOLATILITY_PYTHON, VOLATILITY_WORKER_SCRIPT, self.cwd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            cwd=self.cwd,  # Working directory
+            # Keep terminal signals aimed at the server away from the worker; it exits
+            # on its own once the server closes its stdin
+            start_new_session=(sys.platform != "win32")
+        )
+
+    async def stop(self):
+        if self.process is not None and self.process.returncode is None:
+            self.process.kill()
+            await self.process.wait()
+        self.process = None
+
+    async def request(self, msg: Dict[str, Any]) -> Dict[str, Any]:
+        if self.process is None or self.process.returncode is not None:
+            await self.start()
+        
+        body = json.dumps(msg).encode('utf-8')
+        output = io.BytesIO()
+        try:
+            self.process.stdin.write(_MSG_HEADER.pack(_MSG_REQUEST, len(body)) + body)
+            await self.process.stdin.drain()
+            while True:
+                header = await self.process.stdout.readexactly(_MSG_HEADER.size)
+                kind, length = _MSG_HEADER.unpack(header)
+                payload = await self.process.stdout.readexactly(length)
+                if kind == _MSG_OUTPUT:
+                    output.write(payload)
+                elif kind == _MSG_RESULT:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            await self.stop()
+            raise RuntimeError("Volatility worker exited unexpectedly")
+        except BaseException:
+            # A cancelled request leaves the protocol out of sync, so drop the worker
+            await self.stop()
+            raise
+        
+        result = json.loads(payload.decode('utf-8'))
+        if result.get("restart"):
+            # The run changed state that cannot be reset in-process, start fresh next time
+            await self.stop()
+        # Decode the accumulated output once, now that no chunk boundary can split a character
+        result["stdout"] = output.getvalue().decode('utf-8', errors='replace')
+        return result
+
+class VolatilityWorkerPool:
+    """A fixed-size pool of workers, each handling one request at a time"""
+
+    def __init__(self, size: int):
+        self._workers = [VolatilityWorker() for _ in range(size)]
+        self._idle: asyncio.Queue = asyncio.Queue()
+        for worker in self._workers:
+            self._idle.put_nowait(worker)
+
+    async def request(self, msg: Dict[str, Any]) -> Dict[str, Any]:
+        worker = await self._idle.get()
+        try:
+            return await worker.request(msg)
+        finally:
+            self._idle.put_nowait(worker)
+
+    async def stop(self):
+        """Kill and reap every running worker"""
+        for worker in self._workers:
+            await worker.stop()
+
+# Every plugin run holds a permit, bounding memory use when many tools are called at once.
+# The pool has one worker per permit, so a permit holder never waits for a worker.
+_VOL_SEM = asyncio.BoundedSemaphore(VOL_MAX_CONC)
+_WORKERS = VolatilityWorkerPool(VOL_MAX_CONC)
 
 # Create a wrapper function for running volatility commands
-async def run_volatility(cmd_args, cwd=VOLATILITY_DIR):
+async def run_volatility(cmd_args):
     """Helper function to run volatility commands with proper error handling"""
-    cmd = [VOLATILITY_PYTHON, VOLATILITY_SCRIPT] + cmd_args
+    # Serve help output from the cache while vol.py and the plugins are unchanged
+    cache_key = _help_cache_key(cmd_args)
+    signature = None
+    if cache_key is not None:
+        try:
+            signature = await asyncio.to_thread(_volatility_signature)
+        except OSError:
+            cache_key = None
+        else:
+            cached = _PLUGINS_CACHE.get(cache_key)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+    
+    # Serve plugin output from the disk cache when this dump was analyzed before.
+    # Hashing and file reads are blocking, so they run in a thread.
+    output_cache = None
+    if cache_key is None:
+        output_cache = await asyncio.to_thread(_output_cache_path, cmd_args)
+        if output_cache is not None:
+            cached_output = await asyncio.to_thread(_read_cached_output, output_cache)
+            if cached_output is not None:
+                return cached_output
     
     try:
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            cwd=cwd  # Working directory
-        )
-        stdout, stderr = await process.communicate()
+        async with _VOL_SEM:
+            # On timeout the request is cancelled, which kills and reaps the worker
+            result = await asyncio.wait_for(
+                _WORKERS.request({"args": cmd_args}),
+                timeout=VOL_TIMEOUT or None
+            )
         
-        if process.returncode != 0:
-            stderr_text = stderr.decode('utf-8', errors='replace')
-            return f"Error running Volatility command: {stderr_text}"
+        if result["returncode"] != 0:
+            return f"Error running Volatility command: {result['stderr']}"
         
-        return stdout.decode('utf-8', errors='replace')
+        output = result["stdout"]
+    except asyncio.TimeoutError:
+        return f"Error running Volatility command: timed out after {VOL_TIMEOUT:g} seconds"
     except Exception as e:
         return f"Exception running Volatility: {str(e)}"
+    
+    # Only successful runs are cached
+    if cache_key is not None:
+        _PLUGINS_CACHE[cache_key] = (signature, output)
+        _save_plugins_cache()
+    elif output_cache is not None:
+        await asyncio.to_thread(_store_cached_output, output_cache, output)
+    
+    return output
+
+def _validated_dump(memory_dump_path: str) -> str:
+    """Return the normalized dump path, raising FileNotFoundError if it is not a file"""
+    # Not cached: cacheable runs stat the dump again anyway to key the output cache
+    path = os.path.normpath(memory_dump_path)
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"Memory dump file not found at {path}")
+    return path
 
 @mcp.tool()
 async def list_available_plugins() -> str:
@@ -54,9 +396,10 @@ async def get_image_info(memory_dump_path: str) -> str:
         memory_dump_path: Full path to the memory dump file
     """
     # Validate the path exists
-    memory_dump_path = os.path.normpath(memory_dump_path)
-    if not os.path.isfile(memory_dump_path):
-        return f"Error: Memory dump file not found at {memory_dump_path}"
+    try:
+        memory_dump_path = _validated_dump(memory_dump_path)
+    except FileNotFoundError as e:
+        return f"Error: {e}"
     
     return await run_volatility(["-f", memory_dump_path, "windows.info.Info"])
 
@@ -69,9 +412,10 @@ async def run_pstree(memory_dump_path: str) -> str:
         memory_dump_path: Full path to the memory dump file
     """
     # Validate the path exists
-    memory_dump_path = os.path.normpath(memory_dump_path)
-    if not os.path.isfile(memory_dump_path):
-        return f"Error: Memory dump file not found at {memory_dump_path}"
+    try:
+        memory_dump_path = _validated_dump(memory_dump_path)
+    except FileNotFoundError as e:
+        return f"Error: {e}"
     
     return await run_volatility(["-f", memory_dump_path, "windows.pstree.PsTree"])
 
@@ -84,9 +428,10 @@ async def run_pslist(memory_dump_path: str) -> str:
         memory_dump_path: Full path to the memory dump file
     """
     # Validate the path exists
-    memory_dump_path = os.path.normpath(memory_dump_path)
-    if not os.path.isfile(memory_dump_path):
-        return f"Error: Memory dump file not found at {memory_dump_path}"
+    try:
+        memory_dump_path = _validated_dump(memory_dump_path)
+    except FileNotFoundError as e:
+        return f"Error: {e}"
     
     return await run_volatility(["-f", memory_dump_path, "windows.pslist.PsList"])
 
@@ -99,9 +444,10 @@ async def run_psscan(memory_dump_path: str) -> str:
         memory_dump_path: Full path to the memory dump file
     """
     # Validate the path exists
-    memory_dump_path = os.path.normpath(memory_dump_path)
-    if not os.path.isfile(memory_dump_path):
-        return f"Error: Memory dump file not found at {memory_dump_path}"
+    try:
+        memory_dump_path = _validated_dump(memory_dump_path)
+    except FileNotFoundError as e:
+        return f"Error: {e}"
     
     return await run_volatility(["-f", memory_dump_path, "windows.psscan.PsScan"])
 
@@ -114,9 +460,10 @@ async def run_netscan(memory_dump_path: str) -> str:
         memory_dump_path: Full path to the memory dump file
     """
     # Validate the path exists
-    memory_dump_path = os.path.normpath(memory_dump_path)
-    if not os.path.isfile(memory_dump_path):
-        return f"Error: Memory dump file not found at {memory_dump_path}"
+    try:
+        memory_dump_path = _validated_dump(memory_dump_path)
+    except FileNotFoundError as e:
+        return f"Error: {e}"
     
     return await run_volatility(["-f", memory_dump_path, "windows.netscan.NetScan"])
 
@@ -130,9 +477,10 @@ async def run_malfind(memory_dump_path: str, dump_dir: Optional[str] = None) ->
         dump_dir: Optional directory to dump suspicious memory sections
     """
     # Validate the path exists
-    memory_dump_path = os.path.normpath(memory_dump_path)
-    if not os.path.isfile(memory_dump_path):
-        return f"Error: Memory dump file not found at {memory_dump_path}"
+    try:
+        memory_dump_path = _validated_dump(memory_dump_path)
+    except FileNotFoundError as e:
+        return f"Error: {e}"
     
     cmd_args = ["-f", memory_dump_path, "windows.malfind.Malfind"]
     
@@ -163,9 +511,10 @@ async def run_cmdline(memory_dump_path: str) -> str:
         memory_dump_path: Full path to the memory dump file
     """
     # Validate the path exists
-    memory_dump_path = os.path.normpath(memory_dump_path)
-    if not os.path.isfile(memory_dump_path):
-        return f"Error: Memory dump file not found at {memory_dump_path}"
+    try:
+        memory_dump_path = _validated_dump(memory_dump_path)
+    except FileNotFoundError as e:
+        return f"Error: {e}"
     
     return await run_volatility(["-f", memory_dump_path, "windows.cmdline.CmdLine"])
 
@@ -179,9 +528,10 @@ async def run_dlllist(memory_dump_path: str, pid: Optional[int] = None) -> str:
         pid: Optional process ID to filter results
     """
     # Validate the path exists
-    memory_dump_path = os.path.normpath(memory_dump_path)
-    if not os.path.isfile(memory_dump_path):
-        return f"Error: Memory dump file not found at {memory_dump_path}"
+    try:
+        memory_dump_path = _validated_dump(memory_dump_path)
+    except FileNotFoundError as e:
+        return f"Error: {e}"
     
     cmd_args = ["-f", memory_dump_path, "windows.dlllist.DllList"]
     
@@ -200,9 +550,10 @@ async def run_handles(memory_dump_path: str, pid: Optional[int] = None) -> str:
         pid: Optional process ID to filter results
     """
     # Validate the path exists
-    memory_dump_path = os.path.normpath(memory_dump_path)
-    if not os.path.isfile(memory_dump_path):
-        return f"Error: Memory dump file not found at {memory_dump_path}"
+    try:
+        memory_dump_path = _validated_dump(memory_dump_path)
+    except FileNotFoundError as e:
+        return f"Error: {e}"
     
     cmd_args = ["-f", memory_dump_path, "windows.handles.Handles"]
     
@@ -220,9 +571,10 @@ async def run_filescan(memory_dump_path: str) -> str:
         memory_dump_path: Full path to the memory dump file
     """
     # Validate the path exists
-    memory_dump_path = os.path.normpath(memory_dump_path)
-    if not os.path.isfile(memory_dump_path):
-        return f"Error: Memory dump file not found at {memory_dump_path}"
+    try:
+        memory_dump_path = _validated_dump(memory_dump_path)
+    except FileNotFoundError as e:
+        return f"Error: {e}"
     
     return await run_volatility(["-f", memory_dump_path, "windows.filescan.FileScan"])
 
@@ -236,9 +588,10 @@ async def run_memmap(memory_dump_path: str, pid: int) -> str:
         pid: Process ID to analyze
     """
     # Validate the path exists
-    memory_dump_path = os.path.normpath(memory_dump_path)
-    if not os.path.isfile(memory_dump_path):
-        return f"Error: Memory dump file not found at {memory_dump_path}"
+    try:
+        memory_dump_path = _validated_dump(memory_dump_path)
+    except FileNotFoundError as e:
+        return f"Error: {e}"
     
     return await run_volatility(["-f", memory_dump_path, "windows.memmap.Memmap", "--pid", str(pid)])
 
@@ -253,9 +606,10 @@ async def run_custom_plugin(memory_dump_path: str, plugin_name: str, additional_
         additional_args: Optional additional arguments for the plugin
     """
     # Validate the path exists
-    memory_dump_path = os.path.normpath(memory_dump_path)
-    if not os.path.isfile(memory_dump_path):
-        return f"Error: Memory dump file not found at {memory_dump_path}"
+    try:
+        memory_dump_path = _validated_dump(memory_dump_path)
+    except FileNotFoundError as e:
+        return f"Error: {e}"
     
     # Build the command arguments
     cmd_args = ["-f", memory_dump_path, plugin_name]
@@ -267,12 +621,97 @@ async def run_custom_plugin(memory_dump_path: str, plugin_name: str, additional_
     return await run_volatility(cmd_args)
 
 @mcp.tool()
-async def list_memory_dumps(search_dir: str = None) -> str:
+async def run_triage(memory_dump_path: str, plugins: List[str]) -> Union[str, Dict[str, str]]:
+    """
+    Run several Volatility plugins concurrently against the same memory dump
+    
+    Args:
+        memory_dump_path: Full path to the memory dump file
+        plugins: Names of the plugins to run (e.g. windows.pslist.PsList)
+    """
+    # Validate the path exists
+    try:
+        memory_dump_path = _validated_dump(memory_dump_path)
+    except FileNotFoundError as e:
+        return f"Error: {e}"
+    
+    # Each plugin runs once, however often it was requested; concurrency is bounded
+    # by the worker pool (VOL_MAX_CONC)
+    plugins = list(dict.fromkeys(plugins))
+    results = await asyncio.gather(
+        *[run_volatility(["-f", memory_dump_path, plugin]) for plugin in plugins],
+        return_exceptions=True
+    )
+    
+    return {
+        plugin: result if isinstance(result, str) else f"Exception running Volatility: {str(result)}"
+        for plugin, result in zip(plugins, results)
+    }
+
+# Look for common memory dump extensions, kept as a tuple so str.endswith can match them in one call
+MEMORY_EXTENSIONS = ('.raw', '.vmem', '.dmp', '.mem', '.bin', '.img', '.001', '.dump')
+
+# Dedicated threads for directory walks, so slow disks cannot exhaust the default executor
+_WALK_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="dump-walk")
+
+# Directories that never contain memory dumps but can hold millions of files.
+# Hidden directories (names starting with ".") are skipped as well.
+_SKIP_DIRS = frozenset({
+    "$recycle.bin", "system volume information", "windows", "program files",
+    "program files (x86)", "node_modules", ".git", ".venv", "appdata"
+})
+
+def _is_reparse_point(entry: os.DirEntry) -> bool:
+    """Check for Windows junctions and other reparse points, which is_dir() does not exclude"""
+    if sys.platform != "win32":
+        return False
+    # DirEntry.stat() is served from the directory listing on Windows
+    attributes = entry.stat(follow_symlinks=False).st_file_attributes
+    return bool(attributes & stat.FILE_ATTRIBUTE_REPARSE_POINT)
+
+def _walk_dumps_sync(search_dir: str, max_depth: Optional[int] = None) -> List[str]:
+    """Find memory dump files under search_dir, returning "path (Size: N MB)" entries"""
+    memory_files = []
+    
+    # Walk the tree with os.scandir so each directory is listed once and file
+    # types come from the directory entries; only matching files are stat()ed
+    pending = [(search_dir, 0)]
+    while pending:
+        directory, depth = pending.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        
+        descend = max_depth is None or depth < max_depth
+        subdirs = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    name = entry.name.lower()
+                    if (descend and not name.startswith('.') and name not in _SKIP_DIRS
+                            and not _is_reparse_point(entry)):
+                        subdirs.append((entry.path, depth + 1))
+                elif entry.name.lower().endswith(MEMORY_EXTENSIONS) and entry.is_file():
+                    size_mb = entry.stat().st_size / (1024 * 1024)
+                    memory_files.append(f"{entry.path} (Size: {size_mb:.2f} MB)")
+            except OSError:
+                continue
+        
+        # Visit subdirectories in listing order, like os.walk
+        pending.extend(reversed(subdirs))
+    
+    return memory_files
+
+@mcp.tool()
+async def list_memory_dumps(search_dir: str = None, max_depth: Optional[int] = None) -> str:
     """
     List available memory dump files in a directory
     
     Args:
         search_dir: Directory to search for memory dumps (defaults to current directory)
+        max_depth: Optional number of subdirectory levels to search (0 searches only search_dir)
     """
     if not search_dir:
         search_dir = os.getcwd()
@@ -281,52 +720,81 @@ async def list_memory_dumps(search_dir: str = None) -> str:
     if not os.path.isdir(search_dir):
         return f"Error: Directory not found at {search_dir}"
     
-    # Look for common memory dump extensions
-    memory_extensions = ['.raw', '.vmem', '.dmp', '.mem', '.bin', '.img', '.001', '.dump']
-    memory_files = []
+    if max_depth is not None and max_depth < 0:
+        return f"Error: max_depth must be 0 or greater, got {max_depth}"
     
-    for root, _, files in os.walk(search_dir):
-        for file in files:
-            if any(file.lower().endswith(ext) for ext in memory_extensions):
-                full_path = os.path.join(root, file)
-                size_mb = os.path.getsize(full_path) / (1024 * 1024)
-                memory_files.append(f"{full_path} (Size: {size_mb:.2f} MB)")
+    # The walk is blocking filesystem work, keep it off the event loop
+    memory_files = await asyncio.get_running_loop().run_in_executor(
+        _WALK_EXECUTOR, _walk_dumps_sync, search_dir, max_depth
+    )
     
     if not memory_files:
         return f"No memory dump files found in {search_dir}"
     
     return "Found memory dump files:\n" + "\n".join(memory_files)
 
+# Plugin list served by the volatility://plugins resource, kept as ready-to-send JSON.
+# It is built at server start and rebuilt from a fresh `vol.py -h` run after
+# PLUGINS_REFRESH_SECONDS or on SIGHUP.
+PLUGINS_REFRESH_SECONDS = 3600
+_PLUGINS_JSON: Optional[str] = None
+_PLUGINS_LOADED_AT = float("-inf")
+# The plugin choices, e.g. "{banners.Banners,windows.pslist.PsList,...}", in the Plugins section of `vol.py -h`
+_PLUGINS_RE = re.compile(r"^Plugins:?\n.*?\{([^}]*)\}", re.S | re.M)
+
+async def _refresh_plugins():
+    """Rebuild the plugin list from `vol.py -h` output"""
+    global _PLUGINS_JSON, _PLUGINS_LOADED_AT
+    output = await run_volatility(["-h"])
+    
+    match = _PLUGINS_RE.search(output)
+    if match is None:
+        # Volatility failed, keep the previous list and try again on the next fetch
+        return
+    
+    plugins = [plugin.strip() for plugin in match.group(1).split(",")]
+    _PLUGINS_JSON = json.dumps(plugins, indent=2)
+    _PLUGINS_LOADED_AT = time.monotonic()
+
+def _invalidate_plugins():
+    """Mark the plugin list stale, so the next read rebuilds it"""
+    global _PLUGINS_LOADED_AT
+    _PLUGINS_LOADED_AT = float("-inf")
+
 @mcp.resource("volatility://plugins")
 async def get_volatility_plugins() -> str:
     """Get a list of all available Volatility plugins"""
-    output = await run_volatility(["-h"])
+    if _PLUGINS_JSON is None or time.monotonic() - _PLUGINS_LOADED_AT > PLUGINS_REFRESH_SECONDS:
+        # Rebuild from a fresh `vol.py -h` run; the current list is only replaced on success
+        _PLUGINS_CACHE.pop("-h", None)
+        await _refresh_plugins()
     
-    # Process the output to extract plugins
-    plugins = []
-    capture = False
-    for line in output.split('\n'):
-        if line.strip() == "Plugins":
-            capture = True
-            continue
-        if capture and line.strip() == "":
-            capture = False
-            break
-        if capture:
-            plugins.append(line.strip())
-    
-    return json.dumps(plugins, indent=2)
+    return _PLUGINS_JSON or json.dumps([], indent=2)
 
 @mcp.resource("volatility://help/{plugin}")
 async def get_plugin_help(plugin: str) -> str:
     """Get help for a specific Volatility plugin"""
     return await run_volatility([plugin, "--help"])
 
+def _install_child_watcher():
+    """Use a child watcher whose cost does not grow with the number of workers"""
+    # Python 3.12+ already defaults to pidfd based watching where available, and
+    # Windows has no child watchers
+    if sys.platform == "win32" or sys.version_info >= (3, 12):
+        return
+    if hasattr(os, "pidfd_open"):
+        asyncio.set_child_watcher(asyncio.PidfdChildWatcher())
+    else:
+        asyncio.set_child_watcher(asyncio.ThreadedChildWatcher())
+
 # Run the server
 if __name__ == "__main__":
-    print(f"Starting Volatility MCP Server from: {VOLATILITY_DIR}")
-    print(f"Using Python: {VOLATILITY_PYTHON}")
-    print(f"Using Volatility script: {VOLATILITY_SCRIPT}")
+    # stdout carries the MCP stdio protocol, so status lines go to stderr
+    print(f"Starting Volatility MCP Server from: {VOLATILITY_DIR}", file=sys.stderr)
+    print(f"Using Python: {VOLATILITY_PYTHON}", file=sys.stderr)
+    print(f"Using Volatility script: {VOLATILITY_SCRIPT}", file=sys.stderr)
+    print(f"Using up to {VOL_MAX_CONC} Volatility worker(s): {VOLATILITY_WORKER_SCRIPT}", file=sys.stderr)
     
     # Run the server
+    _install_child_watcher()
     mcp.run()
\ No newline at end of file